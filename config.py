@@ -29,7 +29,13 @@ WTA_DRAW_PDF_URL = "https://wtafiles.wtatennis.com/pdf/draws/{year}/{tournament_
 REQUEST_DELAY = 1.5  # seconds between requests
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 30
-PLAYWRIGHT_TIMEOUT = 30000  # ms
+PLAYWRIGHT_GOTO_TIMEOUT = 15000  # ms, navigation up to DOMContentLoaded
+PLAYWRIGHT_SELECTOR_TIMEOUT = 10000  # ms, waiting for the tables to render
+# Concurrent ITF browser pages, shared by both genders; 0 sizes it from CPU count and memory
+ITF_WORKERS = int(os.getenv("TENNISDRAWS_ITF_WORKERS") or 0)
+# Parsed responses revalidated with ETag / Last-Modified (see scrapers/http_cache.py)
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "http")
+HTTP_CACHE_MAX_AGE_DAYS = 7  # entries unused for this long are deleted
 
 # Name matching
 FUZZY_MATCH_THRESHOLD = 85
@@ -16,6 +16,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
 import time
 import warnings
@@ -34,6 +35,7 @@ from scrapers.itf_entries import scrape_all as scrape_itf
 from scrapers.wta125_tomist import scrape_all as scrape_wta125
 from scrapers.draw_pdfs import scrape_all as scrape_draws
 from scrapers.wikipedia import scrape_all as scrape_wiki
+from scrapers import http_cache
 from matching.name_matcher import build_player_entry_map
 from output.csv_writer import write_csv
 from output.site_writer import write_site_data
@@ -233,11 +235,26 @@ def main():
     )
     args = parser.parse_args()
 
+    # Scrapers that log (rather than print) progress share stdout with the
+    # rest of the run, unadorned, so the output reads as one stream
+    # (only the scrapers' loggers: third-party ones like urllib3, pdfminer and
+    # playwright stay at their defaults)
+    scraper_log = logging.getLogger("scrapers")
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    scraper_log.addHandler(handler)
+    scraper_log.setLevel(logging.INFO)
+    scraper_log.propagate = False
+
     print("=" * 60)
     print("  Tennis Player Entry List Tracker")
     print("=" * 60)
     print()
 
+    # Keep the on-disk HTTP cache (restored between CI runs) from growing
+    # without bound, e.g. one calendar entry per date window
+    http_cache.prune()
+
     # Step 1: Fetch rankings
     print("--- STEP 1: Fetching Rankings ---")
     players = []
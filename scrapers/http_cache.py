@@ -0,0 +1,141 @@
+"""On-disk cache of parsed HTTP payloads, revalidated with conditional GETs.
+
+Each entry stores the response's ETag / Last-Modified validators next to the
+payload parsed from that response. When the server answers 304 Not Modified,
+the stored payload is returned and both the download and the parse are skipped.
+
+Payloads whose freshness is known up front (e.g. from a revision id) are kept
+with get_versioned() instead, with no request made at all; each key holds only
+its latest version.
+
+Entries live as one JSON file per key under config.HTTP_CACHE_DIR, so payloads
+must be JSON-serializable. Reading an entry marks it as used, and prune()
+deletes entries that haven't been used for a while.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+
+import requests
+import config
+
+
+def _entry_path(key: str) -> str:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(config.HTTP_CACHE_DIR, f"{digest}.json")
+
+
+def _load(key: str) -> dict | None:
+    try:
+        with open(_entry_path(key), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    if entry.get("key") != key:
+        return None
+    # The file's mtime records when the entry was last used (see prune)
+    try:
+        os.utime(_entry_path(key))
+    except OSError:
+        pass
+    return entry
+
+
+def _save(key: str, entry: dict) -> None:
+    os.makedirs(config.HTTP_CACHE_DIR, exist_ok=True)
+    path = _entry_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def get_parsed(url: str, parse, key: str | None = None, get=requests.get, **kwargs):
+    """GET url and return parse(response), reusing the cached payload on a 304.
+
+    key identifies the payload (defaults to the url); include a version in it
+    when the parse output changes shape. Extra kwargs are passed to get().
+    HTTP errors are raised as requests exceptions, like resp.raise_for_status().
+    """
+    key = key or url
+    entry = _load(key)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    # Closing the response returns its connection to the pool, which matters
+    # for streamed requests that end before the body has been read
+    with get(url, headers=headers, **kwargs) as resp:
+        if resp.status_code == 304:
+            if entry:
+                return entry["payload"]
+            raise requests.HTTPError(
+                f"304 Not Modified without a cached entry for url: {url}",
+                response=resp,
+            )
+        resp.raise_for_status()
+
+        payload = parse(resp)
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _save(key, {
+            "key": key,
+            "etag": etag,
+            "last_modified": last_modified,
+            "payload": payload,
+        })
+    return payload
+
+
+def get_versioned(key: str, version, compute):
+    """Return compute(), cached on disk under key until version changes.
+
+    version must identify the content (e.g. a revision id); a new version
+    replaces the stored entry. Exceptions from compute() propagate and
+    nothing is stored.
+    """
+    entry = _load(key)
+    if entry and entry.get("version") == version:
+        return entry["payload"]
+
+    payload = compute()
+    _save(key, {"key": key, "version": version, "payload": payload})
+    return payload
+
+
+def prune(max_age_days: float | None = None) -> int:
+    """Delete entries not used in the last max_age_days. Returns how many.
+
+    Defaults to config.HTTP_CACHE_MAX_AGE_DAYS.
+    """
+    if max_age_days is None:
+        max_age_days = config.HTTP_CACHE_MAX_AGE_DAYS
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    try:
+        names = os.listdir(config.HTTP_CACHE_DIR)
+    except OSError:
+        return 0
+    for name in names:
+        path = os.path.join(config.HTTP_CACHE_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
@@ -9,23 +9,112 @@ bot protection blocks raw HTTP requests).
 """
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
 import re
-import time
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import date, timedelta
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from urllib.parse import urlsplit
 
 import config
 
+log = logging.getLogger(__name__)
+
 _playwright_available = True
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright
 except ImportError:
     _playwright_available = False
 
-# Number of concurrent browser workers
+# Upper bound on browser pages open at once when sized automatically
+# (config.ITF_WORKERS overrides it). This is a total shared by both genders,
+# which run at the same time: the same 5 pages that itftennis.com saw when
+# the genders ran one after the other.
 CONCURRENT_WORKERS = 5
 
+# Rough renderer memory per open context, in GB
+_CONTEXT_MEMORY_GB = 0.4
+
+# Acceptance-list table snapshots loaded during the current run, keyed by
+# lowercased URL (futures, so concurrent requests share one page load)
+_TABLES_CACHE: dict[str, asyncio.Future] = {}
+
+# Resource types and third-party hosts the scraper never reads. Stylesheets
+# are deliberately kept: the Incapsula challenge depends on layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "texttrack", "ping"})
+_BLOCKED_HOST_PARTS = (
+    "google-analytics", "googletagmanager", "googlesyndication", "doubleclick",
+    "adservice.google", "facebook", "hotjar", "cookielaw", "onetrust",
+    "scorecardresearch", "quantserve", "twitter", "bat.bing", "clarity.ms",
+)
+
+
+def _should_block(request) -> bool:
+    """True if a request can be aborted without affecting the entry tables."""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        return True
+    host = urlsplit(request.url).hostname or ""
+    return any(part in host for part in _BLOCKED_HOST_PARTS)
+
+
+async def _new_context(browser):
+    """Open a browser context with asset/tracker blocking and cookie consent
+    already recorded, so the OneTrust banner never shows."""
+    context = await browser.new_context()
+    await context.route("**/*", _block_route)
+    consented = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    await context.add_cookies([
+        {"name": "OptanonAlertBoxClosed", "value": consented,
+         "domain": ".itftennis.com", "path": "/"},
+        {"name": "OptanonConsent",
+         "value": "isGpcEnabled=0&interactionCount=1&landingPath=NotLandingPage"
+                  "&groups=C0001%3A1%2CC0002%3A0%2CC0003%3A0%2CC0004%3A0",
+         "domain": ".itftennis.com", "path": "/"},
+    ])
+    return context
+
+
+def _available_memory_gb() -> float | None:
+    """MemAvailable from /proc/meminfo in GB, or None where unavailable."""
+    try:
+        with open("/proc/meminfo", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / (1 << 20)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _optimal_workers() -> int:
+    """Browser pages open at once across all genders: config.ITF_WORKERS if
+    set, otherwise sized from CPU count and available memory."""
+    if config.ITF_WORKERS > 0:
+        return config.ITF_WORKERS
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 2
+    workers = min(cpus, CONCURRENT_WORKERS)
+    mem_gb = _available_memory_gb()
+    if mem_gb is not None:
+        workers = min(workers, int(mem_gb / _CONTEXT_MEMORY_GB))
+    return max(1, workers)
+
+
+async def _block_route(route):
+    """Route handler: abort assets and trackers, let everything else through."""
+    if _should_block(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 # Month abbreviation lookup
 _MONTH_ABBR = {
     "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
@@ -48,10 +137,28 @@ def _build_city_lookup():
 
 _build_city_lookup()
 
+@dataclass(slots=True, frozen=True)
+class _ITFEntry:
+    """One acceptance-list row. Converted to the standard entry dict only for
+    ranked players handed to the main pipeline."""
+    tournament: str
+    tier: str
+    week: str
+    section: str
+    player_name: str
+    player_rank: int
+    player_country: str
+    withdrawn: bool
+    gender: str
+    source: str = "ITFEntries"
+
+
 # Known ITF tier prefixes (longer first to avoid partial matches)
 _ITF_TIER_PREFIXES = ("W100", "W75", "W50", "W35", "W15", "M25", "M15")
+_ITF_TIER_PREFIX_SET = frozenset(_ITF_TIER_PREFIXES)
 
 
+@lru_cache(maxsize=512)
 def _title_case_city(name: str) -> str:
     """Convert an UPPER CASE city name to Title Case, preserving state abbreviations.
 
@@ -82,6 +189,7 @@ def _title_case_city(name: str) -> str:
     return name.title()
 
 
+@lru_cache(maxsize=512)
 def _parse_tournament_name(text: str) -> tuple[str, str]:
     """Parse ITF tournament display name into (city, tier_prefix).
 
@@ -96,23 +204,24 @@ def _parse_tournament_name(text: str) -> tuple[str, str]:
         If no tier prefix found, returns (text_in_title_case, "").
     """
     text = text.strip()
-    tier_prefix = ""
-    city_part = text
-
-    for prefix in _ITF_TIER_PREFIXES:
-        # Match prefix at start (case-insensitive)
-        if text.upper().startswith(prefix + " "):
-            tier_prefix = prefix.upper()
-            city_part = text[len(prefix):].strip()
-            break
 
-    city = _title_case_city(city_part)
-    return city, tier_prefix
+    # The tier is always the first space-separated token (case-insensitive)
+    first, sep, rest = text.partition(" ")
+    first_up = first.upper()
+    if sep and first_up in _ITF_TIER_PREFIX_SET:
+        return _title_case_city(rest.strip()), first_up
+
+    return _title_case_city(text), ""
+
+
+# Two adjacent letters, neither of them lowercase. Every ALL CAPS word of two
+# or more letters contains such a pair, so names without one need no fixing.
+_CAPS_PAIR_RE = re.compile(r"[^\W\d_a-z\u00df-\u00ff]{2}")
 
 
 def _normalize_player_name(name: str) -> str:
     """Fix ALL CAPS names from ITF site: 'Martha MATOULA' -> 'Martha Matoula'."""
-    if not name:
+    if not name or not _CAPS_PAIR_RE.search(name):
         return name
     words = name.split()
     fixed = []
@@ -125,6 +234,12 @@ def _normalize_player_name(name: str) -> str:
     return " ".join(fixed)
 
 
+_DATE_RANGE_RE = re.compile(r"(\d{1,2})\s+(\w{3}).*?(\d{1,2})\s+(\w{3})(?:\s+(\d{4}))?")
+_DAY_RANGE_RE = re.compile(r"(\d{1,2})\s*(?:-|to)\s*(\d{1,2})\s+(\w{3})(?:\s+(\d{4}))?")
+_DAY_MONTH_RE = re.compile(r"(\d{1,2})\s+(\w{3})")
+
+
+@lru_cache(maxsize=256)
 def _parse_date_range(dates_str: str) -> tuple[date | None, date | None]:
     """Parse ITF date string like '16 Feb - 22 Feb 2026', '16 Feb to 22 Feb 2026', or '16 - 22 Feb'.
 
@@ -133,10 +248,7 @@ def _parse_date_range(dates_str: str) -> tuple[date | None, date | None]:
     if not dates_str:
         return None, None
     # Try "DD Mon - DD Mon YYYY" or "DD Mon - DD Mon"
-    m = re.match(
-        r"(\d{1,2})\s+(\w{3}).*?(\d{1,2})\s+(\w{3})(?:\s+(\d{4}))?",
-        dates_str.strip(),
-    )
+    m = _DATE_RANGE_RE.match(dates_str.strip())
     if m:
         year = int(m.group(5)) if m.group(5) else date.today().year
         try:
@@ -146,7 +258,7 @@ def _parse_date_range(dates_str: str) -> tuple[date | None, date | None]:
         except (ValueError, KeyError):
             pass
     # Try "DD - DD Mon YYYY" or "DD to DD Mon YYYY"
-    m2 = re.match(r"(\d{1,2})\s*(?:-|to)\s*(\d{1,2})\s+(\w{3})(?:\s+(\d{4}))?", dates_str.strip())
+    m2 = _DAY_RANGE_RE.match(dates_str.strip())
     if m2:
         year = int(m2.group(4)) if m2.group(4) else date.today().year
         mon = _MONTH_ABBR.get(m2.group(3).lower(), 1)
@@ -159,6 +271,7 @@ def _parse_date_range(dates_str: str) -> tuple[date | None, date | None]:
     return None, None
 
 
+@lru_cache(maxsize=256)
 def _normalize_week(dates_str: str) -> str:
     """Convert dates string to canonical week format 'Mon DD'."""
     start, _ = _parse_date_range(dates_str)
@@ -166,18 +279,71 @@ def _normalize_week(dates_str: str) -> str:
         abbr = _MONTH_NUM_TO_ABBR.get(start.month, "")
         return f"{abbr} {start.day}"
     # Fallback: try to extract first "DD Mon" pattern
-    m = re.match(r"(\d{1,2})\s+(\w{3})", dates_str.strip())
+    m = _DAY_MONTH_RE.match(dates_str.strip())
     if m:
         return f"{m.group(2)} {m.group(1)}"
     return dates_str.strip()
 
 
-def _discover_tournaments_from_calendar(page, gender: str) -> list[dict]:
+# Calendar page: for each tournament link, its href and text plus the text of
+# the date and category cells in its row (card layouts fall back to the
+# card's date element, then the link's grandparent).
+_CALENDAR_LINKS_JS = """links => links.map(el => {
+    let row = el.closest('tr');
+    let dateEl = null;
+    let catEl = null;
+    if (row) {
+        dateEl = row.querySelector('td.date span.date, td.date .date')
+            || row.querySelector('td.date');
+        catEl = row.querySelector('td.category span.category, td.category .category')
+            || row.querySelector('td.category');
+    }
+    if (!dateEl) {
+        let card = el.closest('[class*="card"]');
+        if (card) dateEl = card.querySelector('[class*="date"]');
+    }
+    if (!dateEl && el.parentElement) dateEl = el.parentElement.parentElement;
+    return {
+        href: el.getAttribute('href') || '',
+        text: el.innerText || '',
+        date: (dateEl && dateEl.innerText) || '',
+        category: (catEl && catEl.innerText) || '',
+    };
+})"""
+
+# Acceptance-list page: for every table, the nearest preceding section heading
+# (within five siblings) and every row's cell text — header row from th/td,
+# body rows from td only.
+_TABLES_SNAPSHOT_JS = """tables => tables.map(tbl => {
+    let heading = '';
+    let prev = tbl.previousElementSibling;
+    for (let i = 0; i < 5 && prev; i++) {
+        let txt = (prev.innerText || '').trim().toUpperCase();
+        if (txt.includes('MAIN DRAW') || txt.includes('QUALIFYING')
+                || txt.includes('ALTERNATE') || txt.includes('WITHDRAWAL')) {
+            heading = prev.innerText;
+            break;
+        }
+        prev = prev.previousElementSibling;
+    }
+    let rows = [...tbl.querySelectorAll('tr')].map((r, i) =>
+        [...r.querySelectorAll(i === 0 ? 'th, td' : 'td')].map(c => c.innerText || ''));
+    return {heading: heading, rows: rows};
+})"""
+
+
+_DATE_LABEL_RE = re.compile(r"^Date:\s*", re.IGNORECASE)
+_CATEGORY_LABEL_RE = re.compile(r"^Category:\s*", re.IGNORECASE)
+_CALENDAR_DATES_RE = re.compile(r"(\d{1,2}\s+\w{3}\s*(?:-|to)\s*\d{1,2}\s+\w{3}(?:\s+\d{4})?)")
+_ALPHA_RE = re.compile(r"[A-Za-z]")
+
+
+async def _discover_tournaments_from_calendar(page, gender: str) -> list[dict]:
     """Discover tournaments from the official ITF calendar pages.
 
-    Navigates to the ITF tournament calendar for the current and next
-    3 months, extracts tournament links and dates, and filters to
-    upcoming tournaments starting within [today, today + 30d].
+    Navigates to the ITF tournament calendar for each month that overlaps
+    [today, today + 30d] (usually two), extracts tournament links and dates,
+    and filters to upcoming tournaments starting within that window.
     """
     if gender == "M":
         cal_path = "mens-world-tennis-tour-calendar"
@@ -190,13 +356,16 @@ def _discover_tournaments_from_calendar(page, gender: str) -> list[dict]:
 
     tournaments = []
     seen_urls = set()
-    cookies_dismissed = False
 
-    for month_offset in range(4):
-        # Calculate the month to scrape
-        target = today.replace(day=1)
-        for _ in range(month_offset):
-            target = (target + timedelta(days=32)).replace(day=1)
+    # Tournaments further out have no acceptance lists yet, so months past
+    # the window aren't fetched at all
+    months = [today.replace(day=1)]
+    while months[-1] < cutoff_end.replace(day=1):
+        months.append((months[-1] + timedelta(days=32)).replace(day=1))
+
+    for month_idx, target in enumerate(months):
+        if month_idx:
+            await asyncio.sleep(2)  # Rate limiting between calendar pages
 
         url = (
             f"https://www.itftennis.com/en/tournament-calendar/"
@@ -204,25 +373,23 @@ def _discover_tournaments_from_calendar(page, gender: str) -> list[dict]:
         )
 
         try:
-            page.goto(url, timeout=config.PLAYWRIGHT_TIMEOUT)
-            page.wait_for_load_state("networkidle", timeout=config.PLAYWRIGHT_TIMEOUT)
-            time.sleep(2)
-
-            # Dismiss cookie banner once
-            if not cookies_dismissed:
-                try:
-                    decline_btn = page.query_selector('button:has-text("Decline")')
-                    if decline_btn and decline_btn.is_visible():
-                        decline_btn.click()
-                        time.sleep(0.5)
-                        cookies_dismissed = True
-                except Exception:
-                    pass
-
-            # Find all tournament links on the calendar page
-            links = page.query_selector_all('a[href*="/en/tournament/"]')
+            # Don't wait for the load event; the calendar rows are all we need
+            await page.goto(url, wait_until="domcontentloaded",
+                            timeout=config.PLAYWRIGHT_GOTO_TIMEOUT)
+            # Wait for the calendar table rather than network idle — analytics
+            # requests on itftennis.com keep the network busy. Only the table
+            # itself: rows without a td.date cell are still read (see
+            # _CALENDAR_LINKS_JS fallbacks)
+            await page.wait_for_selector("table", state="attached",
+                                         timeout=config.PLAYWRIGHT_SELECTOR_TIMEOUT)
+
+            # Read every tournament link with its row's date and category
+            # cells in one round trip, rather than several per link
+            links = await page.eval_on_selector_all(
+                'a[href*="/en/tournament/"]', _CALENDAR_LINKS_JS
+            )
             for link in links:
-                href = link.get_attribute("href") or ""
+                href = link["href"]
                 if not href or href in seen_urls:
                     continue
 
@@ -230,7 +397,7 @@ def _discover_tournaments_from_calendar(page, gender: str) -> list[dict]:
                 if "/tournament-calendar/" in href:
                     continue
 
-                text = link.inner_text().strip()
+                text = link["text"].strip()
                 if not text or len(text) < 2:
                     continue
 
@@ -242,57 +409,18 @@ def _discover_tournaments_from_calendar(page, gender: str) -> list[dict]:
 
                 # Extract dates from the sibling date cell in the table row
                 dates = ""
-                try:
-                    date_el = link.evaluate_handle(
-                        """el => {
-                            let row = el.closest('tr');
-                            if (row) {
-                                let dateSpan = row.querySelector('td.date span.date, td.date .date');
-                                if (dateSpan) return dateSpan;
-                                let dateTd = row.querySelector('td.date');
-                                if (dateTd) return dateTd;
-                            }
-                            let card = el.closest('[class*="card"]');
-                            if (card) {
-                                let dateEl = card.querySelector('[class*="date"]');
-                                if (dateEl) return dateEl;
-                            }
-                            return el.parentElement.parentElement;
-                        }"""
-                    )
-                    if date_el and date_el.as_element():
-                        date_text = date_el.as_element().inner_text().strip()
-                        # Remove "Date:" label if present
-                        date_text = re.sub(r"^Date:\s*", "", date_text, flags=re.IGNORECASE)
-                        date_match = re.search(
-                            r"(\d{1,2}\s+\w{3}\s*(?:-|to)\s*\d{1,2}\s+\w{3}(?:\s+\d{4})?)",
-                            date_text,
-                        )
-                        if date_match:
-                            dates = date_match.group(1).strip()
-                except Exception:
-                    pass
+                date_text = link["date"].strip()
+                if date_text:
+                    # Remove "Date:" label if present
+                    date_text = _DATE_LABEL_RE.sub("", date_text)
+                    date_match = _CALENDAR_DATES_RE.search(date_text)
+                    if date_match:
+                        dates = date_match.group(1).strip()
 
                 # Extract category/tier from the sibling category cell
-                cat_text = ""
-                try:
-                    cat_el = link.evaluate_handle(
-                        """el => {
-                            let row = el.closest('tr');
-                            if (row) {
-                                let catSpan = row.querySelector('td.category span.category, td.category .category');
-                                if (catSpan) return catSpan;
-                                let catTd = row.querySelector('td.category');
-                                if (catTd) return catTd;
-                            }
-                            return null;
-                        }"""
-                    )
-                    if cat_el and cat_el.as_element():
-                        cat_text = cat_el.as_element().inner_text().strip()
-                        cat_text = re.sub(r"^Category:\s*", "", cat_text, flags=re.IGNORECASE).strip()
-                except Exception:
-                    pass
+                cat_text = link["category"].strip()
+                if cat_text:
+                    cat_text = _CATEGORY_LABEL_RE.sub("", cat_text).strip()
 
                 # Skip tournaments without dates (junk links from page header/sidebar)
                 if not dates:
@@ -325,34 +453,32 @@ def _discover_tournaments_from_calendar(page, gender: str) -> list[dict]:
                 })
 
         except Exception as e:
-            print(f"    Calendar page failed for {target:%Y-%m}: {e}")
+            log.warning("    Calendar page failed for %s: %s", f"{target:%Y-%m}", e)
             continue
 
-        time.sleep(2)  # Rate limiting between calendar pages
-
     return tournaments
 
 
-def _parse_itf_official_tables(page, tournament: dict, gender: str) -> list[dict]:
+def _parse_itf_official_tables(tables: list[dict], tournament: dict, gender: str) -> list[_ITFEntry]:
     """Parse acceptance list tables from the official ITF website.
 
+    tables is the page snapshot from _TABLES_SNAPSHOT_JS: one
+    {"heading": str, "rows": [[cell text, ...], ...]} per table.
+
     Tables have columns: POSITION, PLAYER, ATP/WTA RANKING, ITF RANKING, ...
     PLAYER cell format: "COUNTRY_CODE\\nPlayer Name"
     """
     entries = []
 
-    tables = page.query_selector_all("table")
     section_order = ["Main Draw", "Qualifying", "Alternates"]
     section_idx = 0
 
     for table in tables:
-        rows = table.query_selector_all("tr")
+        rows = table["rows"]
         if len(rows) < 2:
             continue
 
-        header_row = rows[0]
-        header_cells = header_row.query_selector_all("th, td")
-        header_texts = [c.inner_text().strip().upper() for c in header_cells]
+        header_texts = [c.strip().upper() for c in rows[0]]
 
         if "PLAYER" not in header_texts:
             continue
@@ -368,33 +494,15 @@ def _parse_itf_official_tables(page, tournament: dict, gender: str) -> list[dict
 
         # Detect section from preceding heading text on the page
         detected_section = ""
-        try:
-            heading_el = table.evaluate_handle(
-                """el => {
-                    let prev = el.previousElementSibling;
-                    for (let i = 0; i < 5 && prev; i++) {
-                        let txt = prev.innerText.trim().toUpperCase();
-                        if (txt.includes('MAIN DRAW')) return prev;
-                        if (txt.includes('QUALIFYING')) return prev;
-                        if (txt.includes('ALTERNATE')) return prev;
-                        if (txt.includes('WITHDRAWAL')) return prev;
-                        prev = prev.previousElementSibling;
-                    }
-                    return null;
-                }"""
-            )
-            if heading_el and heading_el.as_element():
-                heading_text = heading_el.as_element().inner_text().strip().upper()
-                if "WITHDRAWAL" in heading_text:
-                    detected_section = "Withdrawals"
-                elif "MAIN DRAW" in heading_text:
-                    detected_section = "Main Draw"
-                elif "QUALIFYING" in heading_text:
-                    detected_section = "Qualifying"
-                elif "ALTERNATE" in heading_text:
-                    detected_section = "Alternates"
-        except Exception:
-            pass
+        heading_text = table["heading"].strip().upper()
+        if "WITHDRAWAL" in heading_text:
+            detected_section = "Withdrawals"
+        elif "MAIN DRAW" in heading_text:
+            detected_section = "Main Draw"
+        elif "QUALIFYING" in heading_text:
+            detected_section = "Qualifying"
+        elif "ALTERNATE" in heading_text:
+            detected_section = "Alternates"
 
         if detected_section:
             section = detected_section
@@ -406,18 +514,17 @@ def _parse_itf_official_tables(page, tournament: dict, gender: str) -> list[dict
         if section == "Withdrawals":
             continue
 
-        for row in rows[1:]:
-            cells = row.query_selector_all("td")
+        for cells in rows[1:]:
             if len(cells) <= player_col:
                 continue
 
-            player_text = cells[player_col].inner_text().strip()
+            player_text = cells[player_col].strip()
             if not player_text:
                 continue
 
             withdrawn = False
             if info_col >= 0 and len(cells) > info_col:
-                info_text = cells[info_col].inner_text().strip()
+                info_text = cells[info_col].strip()
                 if info_text.startswith("W "):
                     withdrawn = True
 
@@ -429,7 +536,7 @@ def _parse_itf_official_tables(page, tournament: dict, gender: str) -> list[dict
                 country = ""
                 name = player_text.strip()
 
-            if not name or not re.search(r"[A-Za-z]", name):
+            if not name or not _ALPHA_RE.search(name):
                 continue
 
             # Skip placeholder entries like "(Special Exempt, if needed)"
@@ -441,193 +548,347 @@ def _parse_itf_official_tables(page, tournament: dict, gender: str) -> list[dict
 
             atp_rank = 0
             if rank_col >= 0 and len(cells) > rank_col:
-                rank_text = cells[rank_col].inner_text().strip()
+                rank_text = cells[rank_col].strip()
                 if rank_text.isdigit():
                     atp_rank = int(rank_text)
 
-            entries.append({
-                "tournament": tournament["name"],
-                "tier": tournament.get("full_tier", "ITF"),
-                "week": tournament.get("dates", ""),
-                "section": section,
-                "player_name": name,
-                "player_rank": atp_rank,
-                "player_country": country,
-                "withdrawn": withdrawn,
-                "gender": gender,
-                "source": "ITFEntries",
-            })
+            entries.append(_ITFEntry(
+                tournament=tournament["name"],
+                tier=tournament.get("full_tier", "ITF"),
+                week=tournament.get("dates", ""),
+                section=section,
+                player_name=name,
+                player_rank=atp_rank,
+                player_country=country,
+                withdrawn=withdrawn,
+                gender=gender,
+            ))
 
     return entries
 
 
-def _worker_scrape_batch(tournaments: list[dict], gender: str, worker_id: int) -> list[dict]:
-    """Worker function: launches its own Playwright browser and scrapes a batch."""
-    all_entries = []
-    cookies_dismissed = False
+def _acceptance_url(itf_url: str) -> str:
+    """Canonical acceptance-list URL for a tournament page URL."""
+    url = itf_url.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+    if not url.endswith("/acceptance-list"):
+        url += "/acceptance-list"
+    return url
+
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+async def _load_acceptance_tables(browser, url: str) -> list[dict]:
+    """Open an acceptance-list page in a fresh context and snapshot its tables.
 
+    The context is closed right after the snapshot to reclaim renderer memory.
+    A navigation that times out is retried once in a brand-new context (a
+    stalled page usually loads fine on a second attempt). A missing PLAYER
+    table is not retried: that is normal for lists not yet published.
+    """
+    for attempt in range(2):
+        context = await _new_context(browser)
         try:
-            for t in tournaments:
-                try:
-                    url = t["itf_url"].rstrip("/")
-                    if not url.endswith("/acceptance-list"):
-                        url += "/acceptance-list"
-
-                    page.goto(url, timeout=config.PLAYWRIGHT_TIMEOUT)
-                    page.wait_for_load_state("networkidle", timeout=config.PLAYWRIGHT_TIMEOUT)
-                    time.sleep(1)
-
-                    if not cookies_dismissed:
-                        try:
-                            decline_btn = page.query_selector('button:has-text("Decline")')
-                            if decline_btn and decline_btn.is_visible():
-                                decline_btn.click()
-                                time.sleep(0.5)
-                                cookies_dismissed = True
-                        except Exception:
-                            pass
-
-                    entries = _parse_itf_official_tables(page, t, gender)
-                    all_entries.extend(entries)
-
-                    time.sleep(1.5)  # Rate limiting between tournaments
-
-                except Exception:
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until="domcontentloaded",
+                                timeout=config.PLAYWRIGHT_GOTO_TIMEOUT)
+            except PlaywrightTimeoutError:
+                if attempt == 0:
                     continue
+                raise
+            # The acceptance tables are rendered client-side; wait for a
+            # header row carrying the PLAYER column
+            await page.wait_for_selector("table tr:has-text('PLAYER')", state="attached",
+                                         timeout=config.PLAYWRIGHT_SELECTOR_TIMEOUT)
+            # Read all tables in one round trip, then parse in Python
+            return await page.eval_on_selector_all("table", _TABLES_SNAPSHOT_JS)
         finally:
-            browser.close()
+            await context.close()
 
-    return all_entries
 
+async def _get_acceptance_tables(browser, url: str,
+                                 pages: asyncio.Semaphore) -> tuple[list[dict] | None, bool]:
+    """Table snapshot for url, loading each page at most once per run.
 
-def _scrape_gender(gender: str, limit: int = 0) -> tuple[list[dict], dict]:
-    """Scrape ITF tournaments for a given gender.
+    Concurrent requests for the same page (e.g. from the other gender's
+    workers) wait on the first load. A load holds one of the shared pages
+    slots. Returns (tables, fetched): tables is None if the page failed to
+    load, fetched is False when served from the run cache.
+    """
+    key = url.lower()
+    pending = _TABLES_CACHE.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending), False
+
+    pending = asyncio.get_running_loop().create_future()
+    _TABLES_CACHE[key] = pending
+    try:
+        async with pages:
+            tables = await _load_acceptance_tables(browser, url)
+    except Exception:
+        # Forget the failure so a later request can retry the page
+        _TABLES_CACHE.pop(key, None)
+        pending.set_result(None)
+        return None, False
+    pending.set_result(tables)
+    return tables, True
+
+
+async def _worker_scrape_queue(browser, queue: asyncio.Queue, gender: str,
+                               pages: asyncio.Semaphore, on_entries) -> tuple[int, int]:
+    """Worker coroutine: pulls tournaments off a shared queue until it is empty.
+
+    All workers share a single Chromium instance; each tournament page is
+    loaded in its own browser context (see _load_acceptance_tables). Scraped
+    entries are handed to on_entries per tournament.
+
+    Returns (tournaments_scraped, entries_found).
+    """
+    scraped = 0
+    found = 0
+
+    while True:
+        try:
+            t = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+
+        tables, fetched = await _get_acceptance_tables(
+            browser, _acceptance_url(t["itf_url"]), pages)
+        if tables is None:
+            continue
+
+        entries = _parse_itf_official_tables(tables, t, gender)
+        on_entries(entries)
+        scraped += 1
+        found += len(entries)
+
+        if fetched:
+            await asyncio.sleep(1.5)  # Rate limiting between tournaments
+
+    return scraped, found
+
+
+async def _scrape_acceptance_lists(browser, tournaments: list[dict], gender: str,
+                                   num_workers: int, pages: asyncio.Semaphore,
+                                   on_entries) -> None:
+    """Scrape all acceptance lists with a pool of workers sharing one browser.
+
+    Workers pull from a shared queue, so a few slow pages only hold up the
+    worker that drew them instead of stalling a pre-assigned batch. pages
+    bounds how many are loading at once across both genders.
+    """
+    gender_label = "Men" if gender == "M" else "Women"
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for t in tournaments:
+        queue.put_nowait(t)
+
+    workers = [
+        asyncio.create_task(
+            _worker_scrape_queue(browser, queue, gender, pages, on_entries)
+        )
+        for _ in range(num_workers)
+    ]
+
+    completed = 0
+    for future in asyncio.as_completed(workers):
+        try:
+            scraped, found = await future
+            completed += 1
+            log.info("  [%s] Worker %d/%d done: %d entries from %d tournaments",
+                     gender_label, completed, num_workers, found, scraped)
+        except Exception as e:
+            log.warning("  [%s] Worker failed: %s", gender_label, e)
+
+
+@lru_cache(maxsize=512)
+def _tournament_key(t_name: str, t_tier: str, gender_label: str, dates: str) -> tuple[str, str]:
+    """Build the ITF page key for a tournament; returns (t_key, week).
+
+    Every row of a tournament shares these fields, so the cache turns the
+    per-row lowercasing and week normalization into a single lookup.
+    """
+    week = _normalize_week(dates)
+    # Key format must match frontend buildItfKey():
+    # city.lower() + "|" + tier.lower() + "|" + gender.lower() + "|" + week.lower()
+    # str.lower() rather than casefold(): keys must match JS toLowerCase()
+    t_key = f"{t_name.lower()}|{t_tier.lower()}|{gender_label.lower()}|{week.lower()}"
+    return t_key, week
+
+
+def _merge_entries(entries: list[_ITFEntry], gender_label: str,
+                   tourn_meta: dict, merged: dict) -> None:
+    """Fold scraped entries into per-tournament metadata and player records.
+
+    Players are deduplicated on insert by (tournament key, name, section);
+    later duplicates only back-fill a missing rank or country.
+    """
+    for entry in entries:
+        t_name = entry.tournament
+        t_tier = entry.tier
+        dates = entry.week
+        t_key, week = _tournament_key(t_name, t_tier, gender_label, dates)
+
+        if t_key not in tourn_meta:
+            tourn_meta[t_key] = {
+                "name": t_name,
+                "tier": t_tier,
+                "gender": gender_label,
+                "week": week,
+                "dates": dates,
+            }
+
+        pkey = (t_key, entry.player_name.lower(), entry.section)
+        existing = merged.get(pkey)
+        if existing is None:
+            merged[pkey] = {
+                "n": entry.player_name,
+                "r": entry.player_rank,
+                "c": entry.player_country,
+                "s": entry.section,
+                "w": entry.withdrawn,
+                "_t": t_key,
+                # Sort key: ranked first (by rank), then unranked
+                "_sort": entry.player_rank if entry.player_rank > 0 else 9999,
+            }
+        else:
+            # Prefer entry with rank
+            if entry.player_rank > 0 and existing["r"] == 0:
+                existing["r"] = entry.player_rank
+                existing["_sort"] = entry.player_rank
+            if entry.player_country and not existing["c"]:
+                existing["c"] = entry.player_country
+
+
+def _group_merged_entries(tourn_meta: dict, merged: dict) -> dict:
+    """Group merged player records by tournament, ranked players first."""
+    players_by_tkey = defaultdict(list)
+    for player in merged.values():
+        players_by_tkey[player.pop("_t")].append(player)
+
+    raw_itf_data = {}
+    for t_key, players in players_by_tkey.items():
+        players.sort(key=itemgetter("_sort"))
+        for player in players:
+            del player["_sort"]
+
+        raw_itf_data[t_key] = {
+            **tourn_meta[t_key],
+            "players": players,
+        }
+    return raw_itf_data
+
+
+async def _scrape_gender_async(browser, gender: str, limit: int,
+                               pages: asyncio.Semaphore) -> tuple[list[dict], dict]:
+    """Discover and scrape one gender's tournaments on the shared browser.
+
+    pages is the budget of browser pages open at once, shared with the other
+    gender.
 
     Returns:
         (ranked_entries, raw_itf_data):
         - ranked_entries: entries with player_rank > 0 (for main pipeline)
         - raw_itf_data: dict keyed by composite key with full entry lists
     """
-    if not _playwright_available:
-        print("  Playwright not installed. Skipping ITF entries.")
-        print("  Install: pip install playwright && python -m playwright install chromium")
-        return [], {}
-
     gender_label = "Men" if gender == "M" else "Women"
-    print(f"Scraping ITF Entries ({gender_label})...")
+    log.info("Scraping ITF Entries (%s)...", gender_label)
+
+    # As each tournament lands, split off ranked entries (for pipeline) and
+    # merge everything into per-tournament lists (for ITF page) — the full
+    # entry list is never materialised
+    ranked_entries = []
+    tourn_meta = {}
+    merged: dict[tuple, dict] = {}
+    total_entries = 0
+
+    def _collect(entries: list[_ITFEntry]) -> None:
+        nonlocal total_entries
+        total_entries += len(entries)
+        ranked_entries.extend(asdict(e) for e in entries if e.player_rank > 0)
+        _merge_entries(entries, gender_label, tourn_meta, merged)
 
     # Step 1: Discover tournaments from calendar
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    async with pages:
+        context = await _new_context(browser)
         try:
-            tournaments = _discover_tournaments_from_calendar(page, gender)
+            page = await context.new_page()
+            tournaments = await _discover_tournaments_from_calendar(page, gender)
         finally:
-            browser.close()
+            await context.close()
+
+    log.info("  Found %d %s's tournaments in date range",
+             len(tournaments), gender_label.lower())
 
-    print(f"  Found {len(tournaments)} {gender_label.lower()}'s tournaments in date range")
+    # The same event can be linked more than once (e.g. with and without a
+    # trailing slash or /acceptance-list); scrape each page only once
+    unique = {}
+    for t in tournaments:
+        unique.setdefault(_acceptance_url(t["itf_url"]).lower(), t)
+    tournaments = list(unique.values())
 
     if limit > 0:
         tournaments = tournaments[:limit]
-        print(f"  Limited to {len(tournaments)} tournaments")
+        log.info("  Limited to %d tournaments", len(tournaments))
 
     if not tournaments:
         return [], {}
 
-    # Step 2: Scrape acceptance lists concurrently
-    num_workers = min(CONCURRENT_WORKERS, len(tournaments))
-    batch_size = (len(tournaments) + num_workers - 1) // num_workers
-    batches = []
-    for i in range(0, len(tournaments), batch_size):
-        batches.append(tournaments[i:i + batch_size])
+    # Step 2: Scrape acceptance lists concurrently (the workers of both
+    # genders share the pages budget)
+    num_workers = min(_optimal_workers(), len(tournaments))
+    log.info("  [%s] Scraping with %d workers...", gender_label, num_workers)
+    await _scrape_acceptance_lists(browser, tournaments, gender, num_workers,
+                                   pages, _collect)
 
-    print(f"  Scraping with {num_workers} concurrent browsers...")
+    raw_itf_data = _group_merged_entries(tourn_meta, merged)
 
-    all_entries = []
+    log.info("  %s total: %d entries (%d ranked) from %d tournaments",
+             gender_label, total_entries, len(ranked_entries), len(raw_itf_data))
+    return ranked_entries, raw_itf_data
 
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        futures = {
-            executor.submit(_worker_scrape_batch, batch, gender, idx): idx
-            for idx, batch in enumerate(batches)
-        }
 
-        completed = 0
-        for future in as_completed(futures):
-            batch_idx = futures[future]
-            try:
-                batch_entries = future.result()
-                all_entries.extend(batch_entries)
-                completed += 1
-                batch = batches[batch_idx]
-                print(f"  Batch {completed}/{len(batches)} done: "
-                      f"{len(batch_entries)} entries from {len(batch)} tournaments")
-            except Exception as e:
-                print(f"  Batch {batch_idx} failed: {e}")
-
-    # Step 3: Split into ranked (for pipeline) and raw (for ITF page)
-    ranked_entries = [e for e in all_entries if e["player_rank"] > 0]
-
-    # Group all entries by tournament for the ITF page
-    raw_itf_data = {}
-    tourn_entries = defaultdict(list)
-    tourn_meta = {}
+async def _scrape_genders_async(genders: tuple[str, ...], limit: int) -> list[tuple[list[dict], dict]]:
+    """Scrape the given genders concurrently against one shared browser."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        # One budget of open pages for all genders, so running them at the
+        # same time doesn't hit itftennis.com any harder
+        pages = asyncio.Semaphore(_optimal_workers())
+        try:
+            return await asyncio.gather(
+                *(_scrape_gender_async(browser, gender, limit, pages) for gender in genders)
+            )
+        finally:
+            await browser.close()
 
-    for entry in all_entries:
-        t_name = entry["tournament"]
-        t_tier = entry.get("tier", "ITF")
-        week = _normalize_week(entry.get("week", ""))
-        # Key format must match frontend buildItfKey():
-        # city.lower() + "|" + tier.lower() + "|" + gender.lower() + "|" + week.lower()
-        t_key = f"{t_name.lower()}|{t_tier.lower()}|{gender_label.lower()}|{week.lower()}"
 
-        if t_key not in tourn_meta:
-            tourn_meta[t_key] = {
-                "name": t_name,
-                "tier": t_tier,
-                "gender": gender_label,
-                "week": week,
-                "dates": entry.get("week", ""),
-            }
+def _scrape_genders(genders: tuple[str, ...], limit: int = 0) -> list[tuple[list[dict], dict]]:
+    """Scrape ITF tournaments for the given genders ("M" / "F").
 
-        tourn_entries[t_key].append({
-            "n": entry["player_name"],
-            "r": entry["player_rank"],
-            "c": entry["player_country"],
-            "s": entry["section"],
-            "w": entry["withdrawn"],
-        })
-
-    for t_key, players in tourn_entries.items():
-        # Deduplicate by name+section
-        seen = {}
-        deduped = []
-        for p in players:
-            pkey = (p["n"].lower(), p["s"])
-            if pkey not in seen:
-                seen[pkey] = p
-                deduped.append(p)
-            else:
-                # Prefer entry with rank
-                if p["r"] > 0 and seen[pkey]["r"] == 0:
-                    seen[pkey]["r"] = p["r"]
-                if p["c"] and not seen[pkey]["c"]:
-                    seen[pkey]["c"] = p["c"]
+    All genders share one Chromium instance, so a run pays the browser cold
+    start once. Returns one (ranked_entries, raw_itf_data) pair per gender.
+    """
+    if not _playwright_available:
+        log.warning("  Playwright not installed. Skipping ITF entries.")
+        log.warning("  Install: pip install playwright && python -m playwright install chromium")
+        return [([], {}) for _ in genders]
 
-        # Sort: ranked first (by rank), then unranked
-        deduped.sort(key=lambda x: (x["r"] if x["r"] > 0 else 9999))
+    try:
+        return asyncio.run(_scrape_genders_async(genders, limit))
+    finally:
+        # Page snapshots are only valid for this run
+        _TABLES_CACHE.clear()
 
-        raw_itf_data[t_key] = {
-            **tourn_meta[t_key],
-            "players": deduped,
-        }
 
-    print(f"  Total: {len(all_entries)} entries ({len(ranked_entries)} ranked) "
-          f"from {len(raw_itf_data)} tournaments")
-    return ranked_entries, raw_itf_data
+def _scrape_gender(gender: str, limit: int = 0) -> tuple[list[dict], dict]:
+    """Scrape ITF tournaments for a given gender.
+
+    Returns:
+        (ranked_entries, raw_itf_data):
+        - ranked_entries: entries with player_rank > 0 (for main pipeline)
+        - raw_itf_data: dict keyed by composite key with full entry lists
+    """
+    return _scrape_genders((gender,), limit)[0]
 
 
 def scrape_men(limit: int = 0) -> tuple[list[dict], dict]:
@@ -648,8 +909,8 @@ def scrape_all(limit: int = 0) -> tuple[list[dict], dict]:
         - ranked_entries: entries with player_rank > 0 (for main pipeline)
         - raw_itf_data: combined dict of all tournament entry lists
     """
-    men_ranked, men_raw = scrape_men(limit)
-    women_ranked, women_raw = scrape_women(limit)
+    # Both genders run side by side on one shared browser
+    (men_ranked, men_raw), (women_ranked, women_raw) = _scrape_genders(("M", "F"), limit)
 
     combined_raw = {}
     combined_raw.update(men_raw)
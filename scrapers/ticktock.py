@@ -3,9 +3,19 @@ from __future__ import annotations
 
 import re
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
+from scrapers import http_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Map tier keys to display names
 TIER_MAP = {
@@ -30,25 +40,62 @@ SECTION_MAP = {
     "qualAlt": "Qualifying Alt",
 }
 
+# Section key -> (section, entry_method) for the output entries.
+# Wild card sections are reclassified:
+# "wc" → Main Draw with entry_method=WC
+# "qualWc" → Qualifying with entry_method=WC
+_SECTION_PLACEMENT = {key: (label, "") for key, label in SECTION_MAP.items()}
+_SECTION_PLACEMENT["wc"] = ("Main Draw", "WC")
+_SECTION_PLACEMENT["qualWc"] = ("Qualifying", "WC")
+
+_SHOW_WEEK_RE = re.compile(r"""showWeek\(['"](\w+)['"][^>]*>([^<]+)<""")
+# A double-quoted string literal (skipped verbatim), an unquoted key after
+# { or , (gets quoted), or a trailing comma before } or ] (gets dropped)
+_JS_TOKEN_RE = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")|(?<=[{,])\s*(\w+)\s*:|,\s*([}\]])')
+# A double-quoted string literal or a brace
+_BRACE_SCAN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]')
+_NON_DIGIT_RE = re.compile(r"\D")
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml",
 }
 
 
-def _fetch_page(url: str) -> str:
-    """Fetch HTML content with retries."""
-    for attempt in range(config.MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=config.REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            resp.encoding = "utf-8"
-            return resp.text
-        except requests.RequestException as e:
-            print(f"  [Retry {attempt+1}/{config.MAX_RETRIES}] TickTock fetch error: {e}")
-            if attempt < config.MAX_RETRIES - 1:
-                time.sleep(2 ** attempt)
-    return ""
+# One pooled session for both pages; transient failures (connection errors,
+# 429 and 5xx) are retried by the adapter with exponential backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=config.MAX_RETRIES,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)))
+
+# Bump when the cached page payload (see _parse_page) changes shape
+_CACHE_VERSION = 1
+
+
+def _fetch_parsed(url: str, parse) -> dict | None:
+    """Fetch a page and return parse(html). Retries are handled by _SESSION.
+
+    The parsed result is cached on disk; if the page hasn't changed since the
+    last run (HTTP 304) the cached result is returned without re-parsing.
+    """
+    def parse_response(resp):
+        resp.encoding = "utf-8"
+        return parse(resp.text)
+
+    try:
+        return http_cache.get_parsed(
+            url, parse_response, key=f"ticktock:v{_CACHE_VERSION}:{url}",
+            get=_SESSION.get, timeout=config.REQUEST_TIMEOUT,
+        )
+    except requests.RequestException as e:
+        print(f"  TickTock fetch error: {e}")
+        return None
 
 
 def _extract_week_dates(html: str) -> dict:
@@ -58,10 +105,7 @@ def _extract_week_dates(html: str) -> dict:
     Returns e.g. {"week1": "Feb 16", "week2": "Feb 23", "week3": "Mar 2"}
     """
     dates = {}
-    for m in re.finditer(
-        r"""showWeek\(['"](\w+)['"]""" + r"""[^>]*>([^<]+)<""",
-        html,
-    ):
+    for m in _SHOW_WEEK_RE.finditer(html):
         week_key = m.group(1)
         date_text = m.group(2).strip()
         if date_text:
@@ -69,6 +113,12 @@ def _extract_week_dates(html: str) -> dict:
     return dates
 
 
+@lru_cache(maxsize=None)
+def _week_assign_re(var_name: str) -> re.Pattern:
+    """Compiled pattern for week assignments, e.g. atpData.week1 = {...}."""
+    return re.compile(rf'{re.escape(var_name)}\.(week\d+)\s*=\s*')
+
+
 def _extract_js_data(html: str, var_name: str) -> dict:
     """Extract the JavaScript data object (atpData or wtaData) from HTML.
 
@@ -79,41 +129,66 @@ def _extract_js_data(html: str, var_name: str) -> dict:
     We extract each week assignment and parse the JS object literal into Python.
     """
     result = {}
+    week_assign_re = _week_assign_re(var_name)
 
-    # Find each week assignment: atpData.week1 = { ... };
-    week_pattern = rf'{var_name}\.(week\d+)\s*=\s*'
-    splits = list(re.finditer(week_pattern, html))
-
-    for match in splits:
+    # Single forward pass over the week assignments (atpData.week1 = { ... };).
+    # Each object is brace-matched no further than the next assignment, so a
+    # malformed week can't swallow the ones after it
+    match = week_assign_re.search(html)
+    while match:
         week_key = match.group(1)
         start = match.end()
+        next_match = week_assign_re.search(html, start)
+        stop = next_match.start() if next_match else len(html)
+        match = next_match
 
-        # Use brace-depth matching to find the complete object
-        depth = 0
-        end = start
-        for i in range(start, len(html)):
-            if html[i] == '{':
-                depth += 1
-            elif html[i] == '}':
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
+        # Weeks assigned something other than an object literal (e.g. null)
+        if not html.startswith("{", start):
+            print(f"  Warning: {var_name}.{week_key} is not an object literal")
+            result[week_key] = {}
+            continue
 
+        end = _find_object_end(html, start, stop)
         chunk = html[start:end]
 
         # Convert JS object literal to valid JSON
         js_obj = _js_to_json(chunk)
 
         try:
-            result[week_key] = json.loads(js_obj)
-        except json.JSONDecodeError as e:
+            result[week_key] = _json_loads(js_obj)
+        except ValueError as e:
             print(f"  Warning: Could not parse {var_name}.{week_key}: {e}")
             result[week_key] = {}
 
     return result
 
 
+def _find_object_end(text: str, start: int, stop: int) -> int:
+    """Return the index just past the object literal starting at start.
+
+    Jumps between braces (skipping over string literals) rather than walking
+    every character. Returns start if the braces don't balance before stop.
+    """
+    depth = 0
+    for m in _BRACE_SCAN_RE.finditer(text, start, stop):
+        tok = m.group()
+        if tok == "{":
+            depth += 1
+        elif tok == "}":
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return start
+
+
+def _js_token_to_json(m: re.Match) -> str:
+    if m.group(1):
+        return m.group(1)
+    if m.group(2):
+        return f' "{m.group(2)}":'
+    return m.group(3)
+
+
 def _js_to_json(js_str: str) -> str:
     """Convert JavaScript object literal to valid JSON.
 
@@ -121,15 +196,10 @@ def _js_to_json(js_str: str) -> str:
     - Unquoted keys: name: -> "name":
     - Single-quoted strings (though not seen in this data)
     - Trailing commas
-    """
-    # Quote unquoted property keys
-    # Match word characters at start of a key position (after { or ,)
-    result = re.sub(r'(?<=[{,])\s*(\w+)\s*:', r' "\1":', js_str)
 
-    # Remove trailing commas before } or ]
-    result = re.sub(r',\s*([}\]])', r'\1', result)
-
-    return result
+    Both fixes are made in a single pass; string literals are copied as-is.
+    """
+    return _JS_TOKEN_RE.sub(_js_token_to_json, js_str)
 
 
 def _parse_tournaments(data: dict, gender: str, week_dates: dict = None) -> list[dict]:
@@ -147,7 +217,7 @@ def _parse_tournaments(data: dict, gender: str, week_dates: dict = None) -> list
         if week_dates and week_key in week_dates:
             week_label = week_dates[week_key]
         else:
-            num = re.sub(r"\D", "", week_key)
+            num = _NON_DIGIT_RE.sub("", week_key)
             week_label = f"Week {num}" if num else week_key
 
         for tier_key, tournaments in tiers.items():
@@ -162,89 +232,80 @@ def _parse_tournaments(data: dict, gender: str, week_dates: dict = None) -> list
                 t_name = tournament.get("name", "Unknown")
 
                 # Process each section (main, qual, alt, wc, qualWc, qualAlt)
-                for section_key, section_label in SECTION_MAP.items():
+                for section_key, (actual_section, entry_method) in _SECTION_PLACEMENT.items():
                     players = tournament.get(section_key, [])
-                    if not isinstance(players, list):
+                    if not players or not isinstance(players, list):
                         continue
 
-                    for player in players:
-                        if not isinstance(player, list) or len(player) < 3:
-                            continue
-
-                        rank = player[0]
-                        name = player[1]
-                        country = player[2]
-                        # 4th element is status flag like "W" for withdrawn
-                        withdrawn = len(player) > 3 and player[3] == "W"
-
-                        # Reclassify wild card sections:
-                        # "wc" → Main Draw with entry_method=WC
-                        # "qualWc" → Qualifying with entry_method=WC
-                        entry_method = ""
-                        actual_section = section_label
-                        if section_key == "wc":
-                            entry_method = "WC"
-                            actual_section = "Main Draw"
-                        elif section_key == "qualWc":
-                            entry_method = "WC"
-                            actual_section = "Qualifying"
-
-                        entries.append({
-                            "tournament": t_name,
-                            "tier": tier_name,
-                            "week": week_label,
-                            "section": actual_section,
-                            "player_name": name,
-                            "player_rank": rank,
-                            "player_country": country,
-                            "withdrawn": withdrawn,
-                            "gender": gender,
-                            "source": "TickTockTennis",
-                            "entry_method": entry_method,
-                        })
+                    # Fields shared by every player in this section, built once
+                    common = {
+                        "tournament": t_name,
+                        "tier": tier_name,
+                        "week": week_label,
+                        "section": actual_section,
+                        "gender": gender,
+                        "source": "TickTockTennis",
+                        "entry_method": entry_method,
+                    }
+
+                    entries.extend(
+                        {
+                            **common,
+                            "player_name": player[1],
+                            "player_rank": player[0],
+                            "player_country": player[2],
+                            # 4th element is status flag like "W" for withdrawn
+                            "withdrawn": len(player) > 3 and player[3] == "W",
+                        }
+                        for player in players
+                        if isinstance(player, list) and len(player) >= 3
+                    )
 
     return entries
 
 
+def _parse_page(html: str, var_name: str, gender: str) -> dict:
+    """Parse a TickTock page into {"weeks": week count, "entries": [...]}."""
+    week_dates = _extract_week_dates(html)
+    data = _extract_js_data(html, var_name)
+    return {"weeks": len(data), "entries": _parse_tournaments(data, gender, week_dates)}
+
+
 def scrape_atp() -> list[dict]:
     """Scrape ATP entry lists from Tick Tock Tennis."""
     print("Scraping Tick Tock Tennis (ATP)...")
-    html = _fetch_page(config.TICKTOCK_ATP_URL)
-    if not html:
+    page = _fetch_parsed(config.TICKTOCK_ATP_URL,
+                         lambda html: _parse_page(html, "atpData", "M"))
+    if page is None:
         print("  Failed to fetch ATP page")
         return []
 
-    week_dates = _extract_week_dates(html)
-    data = _extract_js_data(html, "atpData")
-    entries = _parse_tournaments(data, "M", week_dates)
-
+    entries = page["entries"]
     active = [e for e in entries if not e["withdrawn"]]
     withdrawn = [e for e in entries if e["withdrawn"]]
-    print(f"  Found {len(active)} active entries, {len(withdrawn)} withdrawals across {len(data)} weeks")
+    print(f"  [ATP] Found {len(active)} active entries, {len(withdrawn)} withdrawals across {page['weeks']} weeks")
     return entries
 
 
 def scrape_wta() -> list[dict]:
     """Scrape WTA entry lists from Tick Tock Tennis."""
     print("Scraping Tick Tock Tennis (WTA)...")
-    html = _fetch_page(config.TICKTOCK_WTA_URL)
-    if not html:
+    page = _fetch_parsed(config.TICKTOCK_WTA_URL,
+                         lambda html: _parse_page(html, "wtaData", "F"))
+    if page is None:
         print("  Failed to fetch WTA page")
         return []
 
-    week_dates = _extract_week_dates(html)
-    data = _extract_js_data(html, "wtaData")
-    entries = _parse_tournaments(data, "F", week_dates)
-
+    entries = page["entries"]
     active = [e for e in entries if not e["withdrawn"]]
     withdrawn = [e for e in entries if e["withdrawn"]]
-    print(f"  Found {len(active)} active entries, {len(withdrawn)} withdrawals across {len(data)} weeks")
+    print(f"  [WTA] Found {len(active)} active entries, {len(withdrawn)} withdrawals across {page['weeks']} weeks")
     return entries
 
 
 def scrape_all() -> list[dict]:
-    """Scrape both ATP and WTA entry lists."""
-    atp = scrape_atp()
-    time.sleep(config.REQUEST_DELAY)
-    wta = scrape_wta()
-    return atp + wta
+    """Scrape both ATP and WTA entry lists (the two pages are fetched concurrently)."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        atp = executor.submit(scrape_atp)
+        wta = executor.submit(scrape_wta)
+        return atp.result() + wta.result()
@@ -10,13 +10,32 @@ from __future__ import annotations
 
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 import config
+from scrapers import http_cache
 
 WIKI_API = "https://en.wikipedia.org/w/api.php"
 HEADERS = {"User-Agent": "TennisDrawsBot/1.0 (tennis draws project)"}
 
+# One pooled session for every request in this module (keep-alive reuses
+# the TCP/TLS connection)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+
+# MediaWiki caps action=query at 50 titles per request
+_TITLES_PER_QUERY = 50
+# Existence checks are small; don't let a stalled one hold up the run
+_QUERY_TIMEOUT = 5
+# Articles whose sections are fetched in parallel
+CONCURRENT_REQUESTS = 4
+# Bump when _parse_entrants_wikitext's output changes, to drop cached results
+_CACHE_VERSION = 2
+
+# Titles confirmed missing so far this process; they aren't queried again
+_MISSING_TITLES: set[str] = set()
+
 # Maps calendar tournament name → Wikipedia article title.
 # Only needed when the article name differs from "2026_{Name}_Open"
 # or "2026_{Name}" patterns.
@@ -64,20 +83,38 @@ WIKI_ARTICLE_MAP = {
 }
 
 # Entry method detection from descriptive sentences
-_ENTRY_METHOD_PATTERNS = [
-    (re.compile(r"wildcard", re.IGNORECASE), "WC"),
-    (re.compile(r"protected ranking", re.IGNORECASE), "PR"),
-    (re.compile(r"special exempt", re.IGNORECASE), "SE"),
-    (re.compile(r"lucky loser", re.IGNORECASE), "LL"),
-    (re.compile(r"qualifying draw", re.IGNORECASE), "Q"),
-    (re.compile(r"qualif", re.IGNORECASE), "Q"),
-]
+# One lookahead per method, tried in priority order from the start of the
+# line: the first phrase found anywhere in the line wins, and its group name
+# (m.lastgroup) is the entry method code
+_ENTRY_METHOD_RE = re.compile(
+    r"(?=.*?(?P<WC>wildcard))"
+    r"|(?=.*?(?P<PR>protected ranking))"
+    r"|(?=.*?(?P<SE>special exempt))"
+    r"|(?=.*?(?P<LL>lucky loser))"
+    r"|(?=.*?(?P<Q>qualif))",
+    re.IGNORECASE,
+)
 
 # Section for qualifying wild cards
 _QUAL_WC_PATTERN = re.compile(
     r"wildcard.*qualif|qualif.*wildcard", re.IGNORECASE
 )
 
+# Wikitext parsing
+# A descriptive sentence or a bullet line, surrounding whitespace excluded
+_ENTRANTS_LINE_RE = re.compile(
+    r"^[^\S\n]*((?:[Tt]he following|\*)[^\n]*?)[^\S\n]*$", re.MULTILINE
+)
+_FLAGICON_RE = re.compile(r"\{\{flagicon\|(\w{2,3})\}\}")
+_WIKILINK_RE = re.compile(r"\[\[([^\]|]+?)(?:\|([^\]]+?))?\]\]")
+_SINGLES_ENTRANTS_RE = re.compile(r"singles.*main.*draw.*entrant", re.IGNORECASE)
+# A heading line may end in HTML comments, e.g. "===Other entrants=== <!-- note -->"
+_HEADING_RE = re.compile(
+    r"^(={1,6})[ \t]*(.+?)[ \t]*\1(?:[ \t]|<!--.*?-->)*$", re.MULTILINE
+)
+_WIKILINK_TEXT_RE = re.compile(r"\[\[([^\]|]*)(?:\|([^\]]*))?\]\]")
+_DAY_MONTH_RE = re.compile(r"(\d{1,2})\s+(\w{3})")
+
 
 def _guess_article_names(tournament: str) -> list[str]:
     """Generate candidate Wikipedia article titles for a tournament."""
@@ -94,81 +131,153 @@ def _guess_article_names(tournament: str) -> list[str]:
     ]
 
 
-def _page_exists(title: str) -> bool:
-    """Check if a Wikipedia page exists."""
+def _query_titles(batch: list[str]) -> dict | None:
+    """Run one batched action=query existence check, with retries.
+
+    Returns the response's "query" object, or None (with a warning) if every
+    attempt failed.
+    """
     params = {
         "action": "query",
-        "titles": title,
+        "titles": "|".join(batch),
+        "prop": "info",
         "format": "json",
     }
-    try:
-        resp = requests.get(WIKI_API, params=params, headers=HEADERS, timeout=15)
-        pages = resp.json().get("query", {}).get("pages", {})
-        return "-1" not in pages
-    except Exception:
-        return False
+    for attempt in range(config.MAX_RETRIES):
+        try:
+            resp = _SESSION.get(WIKI_API, params=params, timeout=_QUERY_TIMEOUT)
+            resp.raise_for_status()
+            return resp.json()["query"]
+        except Exception as e:
+            error = e
+        if attempt < config.MAX_RETRIES - 1:
+            time.sleep(2 ** attempt)
+    print(f"  Warning: Wikipedia existence check failed for {len(batch)} titles: {error}")
+    return None
+
 
+def _existing_pages(titles: list[str]) -> dict[str, int]:
+    """Return {title: latest revision id} for the titles that exist on Wikipedia.
 
-def _find_other_entrants_section(title: str) -> int | None:
-    """Find the section index for 'Other entrants' under Singles.
+    Checks up to 50 titles per API request (the MediaWiki limit). Titles are
+    returned as given, even when the API normalizes them (e.g. "_" → " ").
+    Titles already known to be missing are skipped.
+    """
+    existing = {}
+    titles = [t for t in titles if t not in _MISSING_TITLES]
+    for i in range(0, len(titles), _TITLES_PER_QUERY):
+        batch = titles[i:i + _TITLES_PER_QUERY]
+        query = _query_titles(batch)
+        if query is None:
+            continue
 
-    Returns the section index, or None if not found.
+        normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+        found = {
+            page["title"]: page.get("lastrevid", 0)
+            for page in query.get("pages", {}).values()
+            if "missing" not in page and "invalid" not in page
+        }
+        missing = {
+            page["title"]
+            for page in query.get("pages", {}).values()
+            if "missing" in page or "invalid" in page
+        }
+        for t in batch:
+            title = normalized.get(t, t)
+            if title in found:
+                existing[t] = found[title]
+            elif title in missing:
+                _MISSING_TITLES.add(t)
+    return existing
+
+
+def _fetch_page_wikitext(title: str, revid: int = 0) -> str:
+    """Fetch the full wikitext of an article, at revision revid if given.
+
+    Raises on a failed request or an API error.
     """
     params = {
         "action": "parse",
-        "page": title,
-        "prop": "sections",
+        "prop": "wikitext",
         "format": "json",
     }
-    try:
-        resp = requests.get(WIKI_API, params=params, headers=HEADERS, timeout=15)
-        data = resp.json()
-    except Exception:
-        return None
+    if revid:
+        params["oldid"] = revid
+    else:
+        params["page"] = title
+    resp = _SESSION.get(WIKI_API, params=params, timeout=15)
+    resp.raise_for_status()
+    return resp.json()["parse"]["wikitext"]["*"]
 
-    if "parse" not in data:
-        return None
 
-    sections = data["parse"]["sections"]
+def _heading_text(raw: str) -> str:
+    """Heading as displayed: [[Link|Text]] → Text, bold/italic quotes removed."""
+    text = _WIKILINK_TEXT_RE.sub(lambda m: m.group(2) or m.group(1), raw)
+    return text.replace("''", "")
+
+
+def _find_other_entrants_wikitext(wikitext: str) -> str:
+    """Slice the 'Other entrants' section under Singles out of an article's wikitext.
+
+    The slice runs from the heading up to the next heading of the same or a
+    higher level, like the API's per-section wikitext. Returns "" if not found.
+    """
+    headings = [
+        (len(m.group(1)), _heading_text(m.group(2)), m.start())
+        for m in _HEADING_RE.finditer(wikitext)
+    ]
+
     # Find "Singles main draw entrants" or "Singles main-draw entrants"
     singles_idx = None
-    for s in sections:
-        if re.search(r"singles.*main.*draw.*entrant", s["line"], re.IGNORECASE):
-            singles_idx = int(s["index"])
+    for i, (_, text, _) in enumerate(headings):
+        if _SINGLES_ENTRANTS_RE.search(text):
+            singles_idx = i
             break
 
     if singles_idx is None:
-        return None
+        return ""
 
     # Find the first "Other entrants" after the singles section
-    for s in sections:
-        idx = int(s["index"])
-        if idx > singles_idx and "other entrant" in s["line"].lower():
-            return idx
+    for i in range(singles_idx + 1, len(headings)):
+        level, text, start = headings[i]
+        if "other entrant" in text.lower():
+            end = next((h[2] for h in headings[i + 1:] if h[0] <= level), len(wikitext))
+            return wikitext[start:end]
         # Stop if we've gone past singles into doubles
-        if idx > singles_idx and "doubles" in s["line"].lower():
+        if "doubles" in text.lower():
             break
 
-    return None
+    return ""
 
 
-def _fetch_section_wikitext(title: str, section_idx: int) -> str:
-    """Fetch the wikitext for a specific section."""
-    params = {
-        "action": "parse",
-        "page": title,
-        "prop": "wikitext",
-        "section": str(section_idx),
-        "format": "json",
-    }
+def _parse_article(wikitext: str) -> list[dict] | None:
+    """Parse an article's singles "Other entrants" section, None if it has none."""
+    section = _find_other_entrants_wikitext(wikitext)
+    if not section:
+        return None
+
+    return _parse_entrants_wikitext(section)
+
+
+def _fetch_entrants(article: str, revid: int = 0) -> list[dict] | None:
+    """Fetch and parse an article's singles "Other entrants" section.
+
+    The whole article is fetched in one request and the section is sliced out
+    locally. Results are cached on disk per article along with the revision id,
+    so an article that hasn't been edited since the last run isn't downloaded
+    again. Returns None if the article has no such section (or it can't be
+    fetched).
+    """
+    def compute():
+        return _parse_article(_fetch_page_wikitext(article, revid))
+
     try:
-        resp = requests.get(WIKI_API, params=params, headers=HEADERS, timeout=15)
-        data = resp.json()
-        if "parse" in data:
-            return data["parse"]["wikitext"]["*"]
+        if not revid:
+            return compute()
+        return http_cache.get_versioned(
+            f"wikipedia:v{_CACHE_VERSION}:{article}", revid, compute)
     except Exception:
-        pass
-    return ""
+        return None
 
 
 def _parse_entrants_wikitext(wikitext: str) -> list[dict]:
@@ -188,16 +297,15 @@ def _parse_entrants_wikitext(wikitext: str) -> list[dict]:
     current_method = ""
     current_section = "Main Draw"
 
-    for line in wikitext.split("\n"):
-        line = line.strip()
+    # Only the sentences and bullets matter, so scan for them directly rather
+    # than splitting the section into lines
+    for line_m in _ENTRANTS_LINE_RE.finditer(wikitext):
+        line = line_m.group(1)
 
         # Detect descriptive sentence that sets the entry method
-        if line.startswith("The following") or line.startswith("the following"):
-            current_method = ""
-            for pattern, method in _ENTRY_METHOD_PATTERNS:
-                if pattern.search(line):
-                    current_method = method
-                    break
+        if not line.startswith("*"):
+            method_m = _ENTRY_METHOD_RE.match(line)
+            current_method = method_m.lastgroup if method_m else ""
 
             # Check if this is qualifying wild cards
             if _QUAL_WC_PATTERN.search(line):
@@ -210,25 +318,24 @@ def _parse_entrants_wikitext(wikitext: str) -> list[dict]:
             continue
 
         # Parse player bullet points: * {{flagicon|COL}} [[Camila Osorio]]
-        if line.startswith("*"):
-            # Extract country from {{flagicon|XXX}}
-            flag_m = re.search(r"\{\{flagicon\|(\w{2,3})\}\}", line)
-            country = flag_m.group(1) if flag_m else ""
-
-            # Extract player name from [[Player Name]] or [[Link|Display Name]]
-            name_m = re.search(r"\[\[([^\]|]+?)(?:\|([^\]]+?))?\]\]", line)
-            if name_m:
-                player_name = name_m.group(2) if name_m.group(2) else name_m.group(1)
-                # Clean up any remaining markup
-                player_name = player_name.strip()
-
-                if player_name and current_method:
-                    results.append({
-                        "player_name": player_name,
-                        "country": country,
-                        "entry_method": current_method,
-                        "section": current_section,
-                    })
+        # Extract country from {{flagicon|XXX}}
+        flag_m = _FLAGICON_RE.search(line)
+        country = flag_m.group(1) if flag_m else ""
+
+        # Extract player name from [[Player Name]] or [[Link|Display Name]]
+        name_m = _WIKILINK_RE.search(line)
+        if name_m:
+            player_name = name_m.group(2) if name_m.group(2) else name_m.group(1)
+            # Clean up any remaining markup
+            player_name = player_name.strip()
+
+            if player_name and current_method:
+                results.append({
+                    "player_name": player_name,
+                    "country": country,
+                    "entry_method": current_method,
+                    "section": current_section,
+                })
 
     return results
 
@@ -246,70 +353,69 @@ def scrape_all() -> list[dict]:
         (getattr(config, "WTA_CALENDAR", {}), "F"),
     ]
 
-    entries = []
-    found_count = 0
-    tried_count = 0
-
+    tournaments = []
     for calendar, gender in all_calendars:
         for tourn_name, meta in calendar.items():
             # Skip non-standard events
             if tourn_name in ("United Cup", "Hopman Cup"):
                 continue
 
-            tried_count += 1
             city, country, surface, dates, tier = meta
 
             # Extract week from dates: "23 Feb - 1 Mar" → "Feb 23"
-            dm = re.match(r"(\d{1,2})\s+(\w{3})", dates)
+            dm = _DAY_MONTH_RE.match(dates)
             week = f"{dm.group(2)} {dm.group(1)}" if dm else ""
 
-            # Find Wikipedia article
-            candidates = _guess_article_names(tourn_name)
-            article = None
-            for candidate in candidates:
-                if _page_exists(candidate):
-                    article = candidate
-                    break
-                time.sleep(0.5)
-
-            if not article:
-                continue
+            tournaments.append((tourn_name, tier, week, gender,
+                                _guess_article_names(tourn_name)))
+    tried_count = len(tournaments)
+
+    # Check every candidate article title in a handful of batched requests,
+    # then take the first existing candidate per tournament
+    all_candidates = list(dict.fromkeys(
+        title for *_, candidates in tournaments for title in candidates
+    ))
+    existing = _existing_pages(all_candidates)
+
+    resolved = []
+    for tourn_name, tier, week, gender, candidates in tournaments:
+        article = next((c for c in candidates if c in existing), None)
+        if article:
+            resolved.append((tourn_name, tier, week, gender, article))
+
+    # Fetch the "Other entrants" sections a few at a time, each article once
+    # even when both calendars map to it
+    articles = list(dict.fromkeys(r[-1] for r in resolved))
+    with ThreadPoolExecutor(max_workers=CONCURRENT_REQUESTS) as pool:
+        results = dict(zip(articles, pool.map(
+            _fetch_entrants, articles, [existing[a] for a in articles])))
 
-            # Find "Other entrants" section
-            section_idx = _find_other_entrants_section(article)
-            if section_idx is None:
-                time.sleep(0.5)
-                continue
+    entries = []
+    found_count = 0
+    for tourn_name, tier, week, gender, article in resolved:
+        entrants = results[article]
+        if entrants is None:
+            continue
+        found_count += 1
 
-            # Fetch and parse the section
-            wikitext = _fetch_section_wikitext(article, section_idx)
-            if not wikitext:
-                time.sleep(0.5)
+        for entrant in entrants:
+            # Only keep WC, PR, SE, LL (skip Q since we have better sources)
+            if entrant["entry_method"] == "Q":
                 continue
 
-            entrants = _parse_entrants_wikitext(wikitext)
-            found_count += 1
-
-            for entrant in entrants:
-                # Only keep WC, PR, SE, LL (skip Q since we have better sources)
-                if entrant["entry_method"] == "Q":
-                    continue
-
-                entries.append({
-                    "tournament": tourn_name,
-                    "tier": tier,
-                    "week": week,
-                    "section": entrant["section"],
-                    "player_name": entrant["player_name"],
-                    "player_country": entrant["country"],
-                    "player_rank": 0,
-                    "withdrawn": False,
-                    "gender": gender,
-                    "source": "Wikipedia",
-                    "entry_method": entrant["entry_method"],
-                })
-
-            time.sleep(1)  # Rate limiting
+            entries.append({
+                "tournament": tourn_name,
+                "tier": tier,
+                "week": week,
+                "section": entrant["section"],
+                "player_name": entrant["player_name"],
+                "player_country": entrant["country"],
+                "player_rank": 0,
+                "withdrawn": False,
+                "gender": gender,
+                "source": "Wikipedia",
+                "entry_method": entrant["entry_method"],
+            })
 
     print(f"  Found {found_count} tournaments with entrant data "
           f"(tried {tried_count})")
@@ -6,11 +6,18 @@ Static HTML page with inline tournamentData JS object containing WTA 125 entry l
 from __future__ import annotations
 
 import re
+import html as html_lib
 import json
 import time
 import requests
-from bs4 import BeautifulSoup
 import config
+from scrapers import http_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -18,6 +25,42 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml",
 }
 
+# One pooled session for every request in this module (keep-alive reuses
+# the TCP/TLS connection)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+
+_DATA_MARKER = "const tournamentData = "
+_SELECT_OPEN_RE = re.compile(r"""<select\b[^>]*\bid\s*=\s*["']?tSelect\b""", re.IGNORECASE)
+# The dropdown is flat markup, so it's read with regexes instead of building a
+# DOM: each <option ...>text, its attributes (quoted, unquoted or bare, like
+# disabled), and any tags inside its text. As in HTML, </option> is optional:
+# an option also ends at the next <option> or <optgroup>/</optgroup>, or at the
+# end of the select
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_OPTION_RE = re.compile(
+    r"""<option\b((?:[^>"']|"[^"]*"|'[^']*')*)>"""
+    r"""(.*?)(?:</option\s*>|(?=<option\b|</?optgroup\b)|\Z)""",
+    re.IGNORECASE | re.DOTALL,
+)
+_ATTR_RE = re.compile(r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+_TAG_RE = re.compile(r"<[^>]*>")
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE_RE = re.compile(r"\s*")
+_SCRIPT_END_RE = re.compile(r"\s*;?\s*</script>", re.IGNORECASE)
+
+# Streaming the page: stop once each (start, end) marker pair has been seen,
+# i.e. the tournamentData script and the tSelect dropdown are both complete
+_STREAM_MARKERS = (
+    (re.compile(re.escape(_DATA_MARKER)), re.compile(r"</script>", re.IGNORECASE)),
+    (_SELECT_OPEN_RE, re.compile(r"</select>", re.IGNORECASE)),
+)
+_STREAM_CHUNK_SIZE = 1 << 16
+_STREAM_OVERLAP = 256
+
+# Bump when _parse_response's output changes, to drop cached results
+_CACHE_VERSION = 1
+
 # Map type field to section display names
 SECTION_MAP = {
     "MAIN": "Main Draw",
@@ -25,53 +68,106 @@ SECTION_MAP = {
 }
 
 
-def _fetch_page() -> str:
-    """Fetch the full HTML page with retries."""
+def _read_until_complete(resp) -> str:
+    """Read a streamed response until every _STREAM_MARKERS sequence has been seen.
+
+    Returns the text received so far (the whole body if a marker never shows).
+    """
+    parts = []
+    progress = [[0, 0] for _ in _STREAM_MARKERS]  # [next pattern, search from]
+    received = 0
+    tail = ""
+    for chunk in resp.iter_content(chunk_size=_STREAM_CHUNK_SIZE, decode_unicode=True):
+        parts.append(chunk)
+        # Search the new chunk plus the end of the previous one, so markers
+        # split across chunks are still found
+        window = tail + chunk
+        window_start = received - len(tail)
+        received += len(chunk)
+
+        complete = True
+        for patterns, state in zip(_STREAM_MARKERS, progress):
+            while state[0] < len(patterns):
+                m = patterns[state[0]].search(window, max(0, state[1] - window_start))
+                if not m:
+                    break
+                state[0] += 1
+                state[1] = window_start + m.end()
+            if state[0] < len(patterns):
+                complete = False
+        if complete:
+            break
+        tail = window[-_STREAM_OVERLAP:]
+    return "".join(parts)
+
+
+def _parse_response(resp) -> dict:
+    """Read the page and parse out the WTA 125 tournament data and dropdown metadata."""
+    with resp:
+        resp.encoding = "utf-8"
+        html = _read_until_complete(resp)
+
+    tournament_data = _extract_tournament_data(html)
+    return {
+        # Only the WTA 125 lists (URLs containing "125") are used, so only
+        # they are kept in the cache
+        "tournament_data": {k: v for k, v in tournament_data.items() if "125" in k},
+        "metadata": _parse_tournament_metadata(html) if tournament_data else {},
+    }
+
+
+def _fetch_page() -> dict | None:
+    """Fetch and parse the page with retries. Returns None if it can't be fetched.
+
+    The page is ~13 MB, so the body is streamed and the download stops as soon
+    as both the tournamentData script and the tSelect dropdown have arrived.
+    The parsed result is cached on disk; if the page hasn't changed since the
+    last run (HTTP 304) nothing is downloaded at all.
+    """
     url = config.WTA125_TOMIST_URL
     for attempt in range(config.MAX_RETRIES):
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=60)  # larger timeout for 13MB page
-            resp.raise_for_status()
-            resp.encoding = "utf-8"
-            return resp.text
+            # larger timeout for 13MB page
+            return http_cache.get_parsed(
+                url, _parse_response, key=f"wta125_tomist:v{_CACHE_VERSION}:{url}",
+                get=_SESSION.get, timeout=60, stream=True,
+            )
         except requests.RequestException as e:
             print(f"  [Retry {attempt+1}/{config.MAX_RETRIES}] WTA125 Tomist fetch error: {e}")
             if attempt < config.MAX_RETRIES - 1:
                 time.sleep(2 ** attempt)
-    return ""
+    return None
 
 
 def _extract_tournament_data(html: str) -> dict:
-    """Extract the tournamentData JS object using brace-depth matching.
+    """Extract the tournamentData JS object by decoding JSON straight from the page.
 
     Returns dict: {url_key: [{name, country, rank_num, rank, type, pos}, ...], ...}
     """
-    marker = "const tournamentData = "
-    idx = html.find(marker)
+    idx = html.find(_DATA_MARKER)
     if idx == -1:
         print("  Warning: tournamentData not found in page")
         return {}
 
-    start = idx + len(marker)
-
-    # Brace-depth matching to find the complete JSON object
-    depth = 0
-    end = start
-    for i in range(start, len(html)):
-        if html[i] == '{':
-            depth += 1
-        elif html[i] == '}':
-            depth -= 1
-            if depth == 0:
-                end = i + 1
-                break
-
-    json_str = html[start:end]
+    start = _WHITESPACE_RE.match(html, idx + len(_DATA_MARKER)).end()
+
+    # Usually the object is all that's left of its <script>, so hand that
+    # slice to the (faster) _json_loads
+    end_m = _SCRIPT_END_RE.search(html, start)
+    if end_m:
+        try:
+            return _json_loads(html[start:end_m.start()])
+        except ValueError:
+            pass
+
+    # Otherwise raw_decode parses just the object at start and ignores the
+    # rest of the page
     try:
-        return json.loads(json_str)
+        data, _ = _JSON_DECODER.raw_decode(html, start)
     except json.JSONDecodeError as e:
         print(f"  Warning: Could not parse tournamentData: {e}")
         return {}
+    return data
 
 
 def _parse_tournament_metadata(html: str) -> dict:
@@ -79,41 +175,53 @@ def _parse_tournament_metadata(html: str) -> dict:
 
     Returns dict: {url_key: {"name": "WTA 125 Oeiras 2", "week": "Feb 16"}, ...}
     """
-    soup = BeautifulSoup(html, "html.parser")
-    select = soup.find("select", id="tSelect")
-    if not select:
+    select_m = _SELECT_OPEN_RE.search(html)
+    body_start = html.find(">", select_m.end()) + 1 if select_m else 0
+    if not body_start:
         print("  Warning: tSelect dropdown not found")
         return {}
+    body_end = html.find("</select>", body_start)
+    select_body = html[body_start:] if body_end == -1 else html[body_start:body_end]
+    select_body = _COMMENT_RE.sub("", select_body)
 
     metadata = {}
     current_week = ""
 
-    for child in select.children:
-        if not hasattr(child, 'name') or child.name is None:
+    options = list(_OPTION_RE.finditer(select_body))
+    if not options:
+        print("  Warning: tSelect dropdown has no options")
+    for option_m in options:
+        attrs = {}
+        for attr_m in _ATTR_RE.finditer(option_m.group(1)):
+            name, *values = attr_m.groups()
+            attr_value = next((v for v in values if v is not None), "")
+            attrs[name.lower()] = html_lib.unescape(attr_value)
+        # Same as get_text(strip=True): each text piece stripped, then joined
+        text = "".join(
+            piece.strip()
+            for piece in map(html_lib.unescape, _TAG_RE.split(option_m.group(2)))
+        )
+
+        value = attrs.get("value", "")
+
+        # Week header options are disabled
+        if "disabled" in attrs:
+            # "WEEK OF FEBRUARY 16" -> "Feb 16"
+            week_match = re.search(r"WEEK OF (\w+)\s+(\d+)", text)
+            if week_match:
+                month_name = week_match.group(1).capitalize()
+                day = week_match.group(2)
+                # Abbreviate month
+                month_abbrev = month_name[:3]
+                current_week = f"{month_abbrev} {day}"
             continue
 
-        if child.name == "option":
-            text = child.get_text(strip=True)
-            value = child.get("value", "")
-
-            # Week header options are disabled
-            if child.get("disabled") is not None:
-                # "WEEK OF FEBRUARY 16" -> "Feb 16"
-                week_match = re.search(r"WEEK OF (\w+)\s+(\d+)", text)
-                if week_match:
-                    month_name = week_match.group(1).capitalize()
-                    day = week_match.group(2)
-                    # Abbreviate month
-                    month_abbrev = month_name[:3]
-                    current_week = f"{month_abbrev} {day}"
-                continue
-
-            # Tournament option
-            if value and text:
-                metadata[value] = {
-                    "name": text,
-                    "week": current_week,
-                }
+        # Tournament option
+        if value and text:
+            metadata[value] = {
+                "name": text,
+                "week": current_week,
+            }
 
     return metadata
 
@@ -135,22 +243,19 @@ def scrape_all() -> list[dict]:
     """
     print("Scraping WTA 125 entries from TomistGG...")
 
-    html = _fetch_page()
-    if not html:
+    page = _fetch_page()
+    if page is None:
         print("  ERROR: Could not fetch TomistGG page")
         return []
 
-    # Extract raw tournament data
-    tournament_data = _extract_tournament_data(html)
+    # WTA 125 tournament data, and tournament names and weeks from dropdown
+    tournament_data = page["tournament_data"]
+    metadata = page["metadata"]
     if not tournament_data:
         print("  ERROR: No tournament data found")
         return []
 
-    # Extract tournament names and weeks from dropdown
-    metadata = _parse_tournament_metadata(html)
-
-    # Filter to WTA 125 tournaments only (URLs containing "125")
-    wta125_keys = [k for k in tournament_data if "125" in k]
+    wta125_keys = list(tournament_data)
 
     entries = []
     for url_key in wta125_keys:
@@ -8,13 +8,32 @@ Requires: requests, beautifulsoup4 (no Playwright needed).
 from __future__ import annotations
 
 import re
+import json
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import requests
 from bs4 import BeautifulSoup
 
 import config
+from scrapers import http_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# lxml's C parser is much faster than html.parser on full player-list pages
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
 
 HEADERS = {
     "User-Agent": (
@@ -24,6 +43,30 @@ HEADERS = {
     ),
 }
 
+# One pooled session for every request in this module (keep-alive reuses
+# the TCP/TLS connection)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+
+# Player-list pages fetched in parallel
+CONCURRENT_REQUESTS = 5
+
+# Shared across the workers: player-list requests to wtatennis.com still start
+# at least config.REQUEST_DELAY apart, however many are in flight
+_THROTTLE_LOCK = threading.Lock()
+_next_request_at = 0.0
+
+# Section markers in priority order: a tag switches to the first section whose
+# marker is in its data-ui-tab or equals its text
+_SECTION_MARKERS = (
+    ("qualifying", "Qualifying"),
+    ("main draw", "Main Draw"),
+    ("doubles", "DOUBLES"),
+)
+_NO_SECTION = len(_SECTION_MARKERS)
+_SECTION_BY_TEXT = {marker: i for i, (marker, _) in enumerate(_SECTION_MARKERS)}
+_FLAG_SRC_RE = re.compile(r"flags/")
+
 LEVEL_MAP = {
     "WTA 1000": "WTA 1000",
     "WTA 500": "WTA 500",
@@ -32,6 +75,17 @@ LEVEL_MAP = {
 }
 
 
+def _throttle() -> None:
+    """Wait for this thread's turn to start a request (see _THROTTLE_LOCK)."""
+    global _next_request_at
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + config.REQUEST_DELAY
+    if wait > 0:
+        time.sleep(wait)
+
+
 def _fetch_tournament_calendar() -> list[dict]:
     """Fetch upcoming WTA tournaments from the official API."""
     today = datetime.now()
@@ -45,15 +99,16 @@ def _fetch_tournament_calendar() -> list[dict]:
         "pageSize": "50",
     }
 
+    # The window only moves once a day, so reruns revalidate with a conditional GET
     try:
-        resp = requests.get(
+        data = http_cache.get_parsed(
             config.WTA_API_URL,
+            lambda resp: _json_loads(resp.content),
+            key=f"wta_official:calendar:{params['from']}:{params['to']}",
+            get=_SESSION.get,
             params=params,
-            headers=HEADERS,
             timeout=config.REQUEST_TIMEOUT,
         )
-        resp.raise_for_status()
-        data = resp.json()
     except Exception as e:
         print(f"  Error fetching WTA calendar: {e}")
         return []
@@ -94,6 +149,19 @@ def _fetch_tournament_calendar() -> list[dict]:
     return tournaments
 
 
+@lru_cache(maxsize=None)
+def _ui_tab_section(ui_tab: str) -> int:
+    """Index in _SECTION_MARKERS of the first marker in ui_tab, else _NO_SECTION.
+
+    A page only uses a handful of distinct data-ui-tab values, so each one is
+    matched once.
+    """
+    return next(
+        (i for i, (marker, _) in enumerate(_SECTION_MARKERS) if marker in ui_tab),
+        _NO_SECTION,
+    )
+
+
 def _scrape_player_list(tournament: dict) -> list[dict]:
     """Scrape the player list page for a single tournament."""
     url = config.WTA_PLAYER_LIST_URL.format(
@@ -102,30 +170,32 @@ def _scrape_player_list(tournament: dict) -> list[dict]:
         year=tournament["year"],
     )
 
+    _throttle()
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=config.REQUEST_TIMEOUT)
+        resp = _SESSION.get(url, timeout=config.REQUEST_TIMEOUT)
         resp.raise_for_status()
     except Exception as e:
         print(f"    Error scraping {tournament['name']}: {e}")
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, _HTML_PARSER)
 
     entries = []
     current_section = "Main Draw"
 
     # Walk all elements looking for section markers and player names
     for tag in soup.find_all(True):
-        # Check for section changes via data-ui-tab or text content
+        # Check for section changes via data-ui-tab or text content. Headers
+        # wrap a single string (tag.string), so container tags are never
+        # flattened to text the way get_text() on every tag did
         ui_tab = (tag.get("data-ui-tab") or "").lower()
-        text = tag.get_text(strip=True).lower()
+        string = tag.string
+        text = string.strip().lower() if string is not None else ""
 
-        if "qualifying" in ui_tab or text == "qualifying":
-            current_section = "Qualifying"
-        elif "main draw" in ui_tab or text == "main draw":
-            current_section = "Main Draw"
-        elif "doubles" in ui_tab or text == "doubles":
-            current_section = "DOUBLES"
+        section = min(_ui_tab_section(ui_tab),
+                      _SECTION_BY_TEXT.get(text, _NO_SECTION))
+        if section != _NO_SECTION:
+            current_section = _SECTION_MARKERS[section][1]
 
         # Extract player name from data-tracking attribute
         player_name = tag.get("data-tracking-player-name")
@@ -141,7 +211,7 @@ def _scrape_player_list(tournament: dict) -> list[dict]:
         # Look for an <img> with a flag in siblings or parent
         parent = tag.parent
         if parent:
-            flag_img = parent.find("img", src=re.compile(r"flags/"))
+            flag_img = parent.find("img", src=_FLAG_SRC_RE)
             if flag_img:
                 country = (flag_img.get("alt") or "").strip().upper()
 
@@ -173,19 +243,18 @@ def scrape_all() -> list[dict]:
 
     print(f"  Found {len(tournaments)} upcoming WTA tournaments")
 
+    # Player-list pages are independent, so fetch a few at a time; results
+    # come back (and are printed) in calendar order
     all_entries = []
-    for i, t in enumerate(tournaments):
-        print(f"  [{i + 1}/{len(tournaments)}] {t['name']} ({t['tier']})...", end="")
-        entries = _scrape_player_list(t)
-        all_entries.extend(entries)
-
-        # Count sections
-        md = sum(1 for e in entries if e["section"] == "Main Draw")
-        q = sum(1 for e in entries if e["section"] == "Qualifying")
-        print(f" {md} MD, {q} Q")
-
-        if i < len(tournaments) - 1:
-            time.sleep(config.REQUEST_DELAY)
+    with ThreadPoolExecutor(max_workers=CONCURRENT_REQUESTS) as pool:
+        results = pool.map(_scrape_player_list, tournaments)
+        for i, (t, entries) in enumerate(zip(tournaments, results)):
+            all_entries.extend(entries)
+
+            # Count sections
+            counts = Counter(e["section"] for e in entries)
+            print(f"  [{i + 1}/{len(tournaments)}] {t['name']} ({t['tier']})... "
+                  f"{counts['Main Draw']} MD, {counts['Qualifying']} Q")
 
     print(f"  Total: {len(all_entries)} entries from {len(tournaments)} tournaments")
     return all_entries